@@ -42,8 +42,6 @@ from datetime import UTC, datetime
 from pathlib import Path
 from secrets import token_hex
 
-from diffusion_core.config.runner import run_once
-
 
 def _default_run_id() -> str:
     """Creates a unique enough run_id for CI/local. Avoids collisions on fast reruns."""
@@ -53,10 +51,13 @@ def _default_run_id() -> str:
 
 def _cmd_smoke(args: argparse.Namespace) -> int:
     """Runs the run, and organizes run_dir for logging purposes."""
+    # imported here so --help / argparse errors never pay for yaml + pydantic.
+    from diffusion_core.config.runner import run_once
+
     run_dir = run_once(
         config_path=Path(args.config),
         run_root=Path(args.run_root),
-        run_id=str(args.run_id),
+        run_id=str(args.run_id or _default_run_id()),  # default resolved per run, not at build
         argv=sys.argv,  # capture exact invocation
     )
     # single line parsable by tests/tools.
@@ -72,9 +73,7 @@ def build_parser() -> argparse.ArgumentParser:
     s = sub.add_parser("smoke", help="Fast smoke run that only writes contract outputs.")
     s.add_argument("--config", required=True, help="Path to YAML config.")
     s.add_argument("--run-root", required=True, help="Root directory where runs are created.")
-    s.add_argument(
-        "--run-id", default=_default_run_id(), help="Run id prefix (defaults to unique UTC id)."
-    )
+    s.add_argument("--run-id", default=None, help="Run id prefix (defaults to unique UTC id).")
     s.set_defaults(func=_cmd_smoke)
 
     return p
@@ -1,9 +1,31 @@
-from .config_utils import AppConfig, RunConfig, load_config, with_run_root, write_resolved_yaml
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .config_utils import (
+        AppConfig,
+        RunConfig,
+        load_config,
+        load_resolved_config,
+        with_run_root,
+        write_resolved_yaml,
+    )
 
 __all__ = [
     "AppConfig",
     "RunConfig",
     "load_config",
+    "load_resolved_config",
     "with_run_root",
     "write_resolved_yaml",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Lazy exports (PEP 562): config_utils (yaml + pydantic) loads on first access."""
+    if name in __all__:
+        from . import config_utils
+
+        return getattr(config_utils, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
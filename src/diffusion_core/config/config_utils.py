@@ -11,8 +11,11 @@ Importables
 
     ### helpers
     load_config:        loads yaml, validates with model_validate(`cfg`) on AppConfig dict
-    with_run_root:      **copies** and updates cfg dict with overrides in AppConfig
-    write_resolved_yaml: writes the true, final resolved yaml into out_path (in run dir)
+                        (parsed result cached as json, see _cfg_cache_path)
+    with_run_root:      **copies** and updates cfg dict with overrides in AppConfig (no re-validate)
+    write_resolved_yaml: writes the true, final resolved yaml into out_path (in run dir),
+                         plus a sibling .json copy for machine reloads
+    load_resolved_config: reloads a run's resolved config from that .json (never the yaml)
 
 
 *Tested by: tests/config/test_config_utils.py*
@@ -20,11 +23,38 @@ Importables
 
 from __future__ import annotations
 
+import hashlib
+import json
+import os
 from pathlib import Path
 from typing import Any
 
 import yaml
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, Field, ValidationError
+
+from diffusion_core.config.run_layout import write_atomic
+
+# Prefer libyaml (C) when PyYAML was built with it; same safe schema either way.
+try:
+    from yaml import CSafeDumper as _Dumper
+    from yaml import CSafeLoader as _Loader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeDumper as _Dumper  # type: ignore
+    from yaml import SafeLoader as _Loader  # type: ignore
+
+
+def _load_yaml(path: Path) -> Any:
+    """
+    Parse a YAML file into plain python objects (the single YAML read backend).
+    Raw bytes go straight to the parser, so libyaml does the decoding in C.
+    """
+    # upon empty or `null`, return plain {} (avoids `None` passing in)
+    return yaml.load(path.read_bytes(), Loader=_Loader) or {}
+
+
+def _dump_yaml(payload: Any) -> str:
+    """Emit YAML with the same backend `_load_yaml` reads with (keys sorted)."""
+    return yaml.dump(payload, Dumper=_Dumper, sort_keys=True)
 
 
 class RunConfig(BaseModel):
@@ -40,7 +70,8 @@ class RunConfig(BaseModel):
 
     """
 
-    model_config = ConfigDict(extra="forbid", frozen=True)
+    # defer_build: the validator is compiled on first validation, not at import.
+    model_config = ConfigDict(extra="forbid", frozen=True, defer_build=True)
 
     experiment_name: str = "smoke"
     run_root: str = "runs"
@@ -57,28 +88,117 @@ class AppConfig(BaseModel):
         run = RunConfig()   (previously untouched cfg)
     """
 
-    model_config = ConfigDict(extra="forbid", frozen=True)
+    # defer_build: the validator is compiled on first validation, not at import.
+    model_config = ConfigDict(extra="forbid", frozen=True, defer_build=True)
 
     seed: int = 0
-    run: RunConfig = RunConfig()
+    run: RunConfig = Field(default_factory=RunConfig)  # not built at class creation (defer_build)
+
+
+# Bumped whenever the cache body changes meaning; older entries then simply miss.
+# 2: body holds only the fields the yaml set (1 held the full dump, defaults included).
+_CFG_CACHE_FORMAT = 2
+
+
+def _cfg_cache_path(path: Path) -> Path:
+    """
+    Cache file for a config: `$XDG_CACHE_HOME/diffusion_core/cfg/<sha1(abspath)>.json`
+    (`~/.cache` if XDG_CACHE_HOME is unset). Safe to delete at any time.
+    """
+    cache_root = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    digest = hashlib.sha1(str(path.resolve()).encode("utf-8")).hexdigest()
+    return Path(cache_root) / "diffusion_core" / "cfg" / f"{digest}.json"
+
+
+def _read_cfg_cache(cache_path: Path, key: list[int]) -> bytes | None:
+    """
+    Cache layout: line 1 is the json key `[format, st_mtime_ns, st_size]`, the rest is
+    the json of the explicitly set fields (see _write_cfg_cache).
+    Returns the raw json bytes (for model_validate_json), or None on miss/unreadable file.
+    """
+    try:
+        with cache_path.open("rb") as f:
+            if json.loads(f.readline()) != key:
+                return None
+            return f.read()
+    except (OSError, ValueError):
+        return None
+
+
+def _write_cfg_cache(cache_path: Path, key: list[int], cfg: AppConfig) -> None:
+    """
+    Best effort: written atomically (write_atomic), never fails the load.
+    Only fields the YAML actually set are stored (exclude_unset), so defaults are always
+    filled from the current code on a hit, never frozen into the cache.
+    """
+    payload = json.dumps(key) + "\n" + cfg.model_dump_json(exclude_unset=True)
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        write_atomic(cache_path, payload.encode("utf-8"))
+    except OSError:
+        pass  # read-only home, full disk, ...: the cache is only ever an optimization.
 
 
 def load_config(path: Path) -> AppConfig:
-    """Load YAML and validate strictly (unknown keys hard-fail)."""
-    raw: Any
-    with path.open("r", encoding="utf-8") as f:
-        raw = (
-            yaml.safe_load(f) or {}
-        )  # upon empty or `null`, return plain {} (avoids `None` passing in)
-    return AppConfig.model_validate(raw)
+    """
+    Load YAML and validate strictly (unknown keys hard-fail).
+
+    The fields the YAML set are cached as json keyed on the file's (mtime_ns, size) and
+    _CFG_CACHE_FORMAT; an unchanged config skips the YAML parse. Cache hits are validated
+    (from json bytes) against the current models, which also supply the defaults.
+    """
+    st = path.stat()
+    key = [_CFG_CACHE_FORMAT, st.st_mtime_ns, st.st_size]
+    cache_path = _cfg_cache_path(path)
+
+    cached = _read_cfg_cache(cache_path, key)
+    if cached is not None:
+        # json parse + validate fused in pydantic-core (no intermediate dict).
+        # A corrupt or outdated cache entry just falls through to the yaml.
+        try:
+            return AppConfig.model_validate_json(cached)
+        except ValidationError:
+            pass
+
+    cfg = AppConfig.model_validate(_load_yaml(path))
+    _write_cfg_cache(cache_path, key, cfg)
+    return cfg
 
 
 def with_run_root(cfg: AppConfig, run_root: Path) -> AppConfig:
-    """Return a new config with run.run_root overridden (no mutation)."""
-    return cfg.model_copy(update={"run": cfg.run.model_copy(update={"run_root": str(run_root)})})
+    """
+    Return a new config with run.run_root overridden (no mutation).
+
+    Invariant: `cfg` is already validated (came through load_config), and `str(run_root)`
+    satisfies the field type, so the copy is built with model_construct (no re-validation).
+    Only the disk-ingest boundaries (load_config, load_resolved_config) validate.
+    """
+    new_run = RunConfig.model_construct(**{**cfg.run.__dict__, "run_root": str(run_root)})
+    return AppConfig.model_construct(**{**cfg.__dict__, "run": new_run})
+
+
+def _resolved_json_path(yaml_path: Path) -> Path:
+    """config.resolved.yaml -> config.resolved.json (the machine-readable sibling)."""
+    return yaml_path.with_suffix(".json")
 
 
 def write_resolved_yaml(cfg: AppConfig, out_path: Path) -> None:
-    """Write resolved config snapshot (this is what actually ran)."""
+    """
+    Write resolved config snapshot (this is what actually ran).
+
+    out_path (yaml) is for humans; the json sibling (see _resolved_json_path) is what
+    reloads read, since json bytes validate in one pass via model_validate_json.
+    """
+    # both files are written atomically: a crash never leaves a half-written snapshot.
+    write_atomic(_resolved_json_path(out_path), cfg.model_dump_json(indent=2).encode() + b"\n")
     payload = cfg.model_dump(mode="python")
-    out_path.write_text(yaml.safe_dump(payload, sort_keys=True), encoding="utf-8")
+    write_atomic(out_path, _dump_yaml(payload).encode("utf-8"))
+
+
+def load_resolved_config(path: Path) -> AppConfig:
+    """
+    Reload a resolved config snapshot written by write_resolved_yaml.
+    Accepts either the .yaml or the .json path; only the json is ever read.
+    Raises pydantic.ValidationError if the snapshot no longer matches the schema.
+    """
+    return AppConfig.model_validate_json(_resolved_json_path(path).read_bytes())
@@ -6,15 +6,23 @@ Why: ensure layout meets expectations for A): humans, B): machine parsers.
 
 ### importable:
     create_run_dir: creates run layout, fails on existing run_dir check, returns RunPaths dataclass.
+    write_atomic:   writes a run file via a sibling temp file + os.replace (never half-written).
 
 *Tested by: tests/config/test_run_layout.py*
 """
 
 from __future__ import annotations
 
+import contextlib
+import os
+import re
 from dataclasses import dataclass
 from pathlib import Path
 
+# Anything but (unicode) alnum, "-" or "_" becomes "-" in run dir names.
+# `\w` is exactly str.isalnum() plus "_", so this matches the old per-char rule.
+_UNSAFE_NAME_CHARS = re.compile(r"[^\w-]")
+
 
 @dataclass(frozen=True)
 class RunPaths:
@@ -39,7 +47,7 @@ def create_run_dir(run_root: Path, experiment_name: str, *, run_id: str) -> RunP
       - ckpts/last/
       - artifacts/
     """
-    safe = "".join(c if (c.isalnum() or c in "-_") else "-" for c in experiment_name).strip("-")
+    safe = _UNSAFE_NAME_CHARS.sub("-", experiment_name).strip("-")
     rid = f"{run_id}_{safe or 'run'}"
 
     run_dir = run_root / rid
@@ -52,14 +60,17 @@ def create_run_dir(run_root: Path, experiment_name: str, *, run_id: str) -> RunP
 
     # Check: fail if run_dir already exists (no silent reuse/merging issues).
     run_dir.mkdir(parents=True, exist_ok=False)  # might want to add a more specific error message
-    meta_dir.mkdir(parents=True, exist_ok=False)
-    logs_dir.mkdir(parents=True, exist_ok=False)
-    ckpts_dir.mkdir(parents=True, exist_ok=False)
-    artifacts_dir.mkdir(parents=True, exist_ok=False)
-    ckpt_last_dir.mkdir(parents=True, exist_ok=False)
+    # run_dir is brand new, so the children are one plain mkdir each (no parent walk).
+    meta_dir.mkdir()
+    logs_dir.mkdir()
+    ckpts_dir.mkdir()
+    artifacts_dir.mkdir()
+    ckpt_last_dir.mkdir()  # after ckpts_dir
 
     # Create empty metrics file, as part of layout expectations.
-    metrics_jsonl.write_text("", encoding="utf-8")
+    # (bare O_EXCL create: one syscall, no text-io setup to write zero bytes;
+    #  0o666 so the umask decides the mode, like every other file written here)
+    os.close(os.open(metrics_jsonl, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o666))
 
     # to cli:
     return RunPaths(
@@ -71,3 +82,19 @@ def create_run_dir(run_root: Path, experiment_name: str, *, run_id: str) -> RunP
         metrics_jsonl=metrics_jsonl,
         ckpt_last_dir=ckpt_last_dir,
     )
+
+
+def write_atomic(path: Path, data: bytes) -> None:
+    """
+    Write `data` to `path` atomically: one sequential write to a sibling temp file,
+    then os.replace. Readers see either the old file or the complete new one.
+    The temp file is removed if anything fails (the error is re-raised).
+    """
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        tmp.write_bytes(data)
+        os.replace(tmp, path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            tmp.unlink()
+        raise
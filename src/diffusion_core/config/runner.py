@@ -5,7 +5,7 @@ Why: separate tests (speed + tracebacks) & bloat from the main CLI entrypoint.
 
 Logic flow at play:
   load validated config -> override run_root
-  -> create run_dir layout -> write config.resolved.yaml
+  -> create run_dir layout -> write config.resolved.yaml (+ .json)
   -> runtime provenance logging
   Return: run_dir   (for use from CLI)
 
@@ -33,7 +33,7 @@ def run_once(
     """
     Sub entrypoint CLI running logic:
       load validated config -> override run_root
-      -> create run_dir layout -> write config.resolved.yaml
+      -> create run_dir layout -> write config.resolved.yaml (+ .json)
       -> runtime provenance logging
     Returns: run_dir
     """
@@ -18,17 +18,29 @@ from __future__ import annotations
 
 import hashlib
 import json
+import mmap
 import os
-import platform
+import stat
 import subprocess
 import sys
-from collections.abc import Iterable, Sequence
+from collections.abc import Iterable, Iterator, Sequence
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import UTC, datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
+
+from diffusion_core.config.run_layout import write_atomic
+
+try:  # optional: faster indented/sorted json dumps, stdlib json is the fallback
+    import orjson  # type: ignore
+except ImportError:
+    orjson = None  # type: ignore
+
+_MMAP_MIN_BYTES = 1 << 20  # files at least this big are hashed via mmap
 
 
 @dataclass(frozen=True)
@@ -47,6 +59,9 @@ class ProvenanceModel(BaseModel):
     Integrety checks done in validate_provenance_file() instead.
     """
 
+    # Only compiled when a bundle is actually written/validated (not on import).
+    model_config = ConfigDict(defer_build=True)
+
     schema_version: str = Field(default="v1")
 
     created_utc: str
@@ -60,13 +75,54 @@ class ProvenanceModel(BaseModel):
     fid_stats: dict[str, Any] | None
 
 
-def _sha256_file(path: Path) -> str:
-    """Logs sha256."""
-    h = hashlib.sha256()
-    with path.open("rb") as f:
-        for chunk in iter(lambda: f.read(1024 * 1024), b""):
-            h.update(chunk)
-    return h.hexdigest()
+def _json_bytes(obj: Any) -> bytes:
+    """
+    Pretty json as written to meta/: 2-space indent, sorted keys, raw UTF-8, trailing newline.
+    Both backends write the same bytes for what meta/ holds (str, int, bool, None, lists,
+    dicts). Floats are not covered: their text differs (orjson `1e20`, stdlib `1e+20`).
+    """
+    if orjson is not None:
+        return orjson.dumps(
+            obj, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS | orjson.OPT_APPEND_NEWLINE
+        )
+    return (json.dumps(obj, indent=2, sort_keys=True, ensure_ascii=False) + "\n").encode("utf-8")
+
+
+def _sha256_file(path: Path, st: os.stat_result | None = None) -> str:
+    """
+    Logs sha256. Memoized per (absolute path, mtime_ns, size), so hashing an unchanged file
+    again while writing a bundle is free; rewrites normally get a new key.
+    Pass `st` when the caller already stat'ed the file.
+    Write side only: a same-size rewrite within one mtime tick (or with mtime restored)
+    keeps the old key, so integrity checks must use _sha256_file_uncached.
+    """
+    if st is None:
+        st = path.stat()
+    return _sha256_cached(os.path.abspath(path), st.st_mtime_ns, st.st_size)
+
+
+@lru_cache(maxsize=256)
+def _sha256_cached(path_str: str, mtime_ns: int, size: int) -> str:
+    """Memo for _hash_file. mtime_ns/size are only there to key the cache."""
+    return _hash_file(path_str, size)
+
+
+def _sha256_file_uncached(path: Path) -> str:
+    """sha256 from the bytes on disk, always re-read (what validation must compare against)."""
+    return _hash_file(os.path.abspath(path), path.stat().st_size)
+
+
+def _hash_file(path_str: str, size: int) -> str:
+    """Hashes path_str (size picks the read path)."""
+    if size >= _MMAP_MIN_BYTES:
+        # one update() over the mapped file: no read buffers, memory-bound hashing
+        with open(path_str, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            h = hashlib.sha256()
+            h.update(mm)
+            return h.hexdigest()
+    # unbuffered + file_digest: readinto one reused 256 KiB buffer, no per-chunk bytes objects
+    with open(path_str, "rb", buffering=0) as f:
+        return hashlib.file_digest(f, "sha256").hexdigest()
 
 
 def _run(cmd: list[str], cwd: Path) -> tuple[int, str]:
@@ -85,23 +141,21 @@ def _run(cmd: list[str], cwd: Path) -> tuple[int, str]:
     return p.returncode, (p.stdout or "").strip()
 
 
-def _git_repo_root() -> Path:
-    """Logs repo root. Returns RuntimeError if 'not in a repo' (if the command fails)."""
-    rc, out = _run(["git", "rev-parse", "--show-toplevel"], cwd=Path.cwd())
-    if rc != 0 or not out:
+def _git_root_and_sha() -> tuple[Path, str]:
+    """
+    Logs repo root + HEAD sha in a single git call (one fork instead of two).
+    Raises RuntimeError if 'not in a repo' or HEAD has no commit yet (git output says which).
+    """
+    rc, out = _run(["git", "rev-parse", "--show-toplevel", "HEAD"], cwd=Path.cwd())
+    lines = out.splitlines()
+    if rc != 0 or len(lines) < 2:
         raise RuntimeError(
-            "Provenance requires git metadata, but this does not look like a git repo.\n"
+            "Provenance requires git metadata (repo root + HEAD sha), "
+            "but this does not look like a git repo with a commit.\n"
             f"git output:\n{out}"
         )
-    return Path(out).resolve()
-
-
-def _git_sha(repo_root: Path) -> str:
-    """Logs git sha."""
-    rc, out = _run(["git", "rev-parse", "HEAD"], cwd=repo_root)
-    if rc != 0 or not out:
-        raise RuntimeError(f"Failed to get git SHA.\n{out}")
-    return out.strip()
+    # stderr is merged into out; the two answers are always the last lines.
+    return Path(lines[-2]).resolve(), lines[-1].strip()
 
 
 def _git_dirty(repo_root: Path) -> bool:
@@ -196,29 +250,67 @@ def _torch_snapshot() -> dict[str, Any]:
     return snap
 
 
-def _iter_manifest_files(run_dir: Path) -> Iterable[Path]:
+def _stat_regular(path: Path) -> os.stat_result | None:
+    """One stat: the result if path is a regular file, else None (missing, dir, ...)."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st if stat.S_ISREG(st.st_mode) else None
+
+
+def _scan_files(root: Path) -> Iterator[tuple[Path, os.stat_result]]:
     """
-    Organizes the current manifest logs.
-      - config.resolved.yaml
+    Recursive os.scandir walk yielding (file, stat). File/dir type comes from the
+    directory listing itself, so each file costs a single stat (reused for size + hash key).
+    """
+    try:
+        it = os.scandir(root)
+    except OSError:  # missing / not a dir
+        return
+    with it:
+        for entry in it:
+            if entry.is_dir(follow_symlinks=False):
+                yield from _scan_files(Path(entry.path))
+            elif entry.is_file():
+                yield Path(entry.path), entry.stat()
+
+
+def _iter_manifest_files(run_dir: Path) -> Iterable[tuple[Path, os.stat_result]]:
+    """
+    Organizes the current manifest logs, as (path, stat) pairs.
+      - config.resolved.yaml (+ config.resolved.json)
       - logs/metrics.jsonl
       - artifacts/**/*
       - meta/pip_freeze.txt
     Excludes ckpts by default (huge). (Should expand this later).
     """
-    root_files = [run_dir / "config.resolved.yaml", run_dir / "logs" / "metrics.jsonl"]
+    root_files = [
+        run_dir / "config.resolved.yaml",
+        run_dir / "config.resolved.json",
+        run_dir / "logs" / "metrics.jsonl",
+    ]
     for p in root_files:
-        if p.exists() and p.is_file():
-            yield p
+        st = _stat_regular(p)
+        if st is not None:
+            yield p, st
 
-    artifacts = run_dir / "artifacts"
-    if artifacts.exists():
-        for p in artifacts.rglob("*"):
-            if p.is_file():
-                yield p
+    yield from _scan_files(run_dir / "artifacts")
 
     meta_freeze = run_dir / "meta" / "pip_freeze.txt"
-    if meta_freeze.exists() and meta_freeze.is_file():
-        yield meta_freeze
+    st = _stat_regular(meta_freeze)
+    if st is not None:
+        yield meta_freeze, st
+
+
+def _manifest_entry(run_dir: Path, item: tuple[Path, os.stat_result]) -> ManifestEntry:
+    """Size + sha256 of one manifest file (relpath is relative to run_dir)."""
+    path, st = item
+    return ManifestEntry(
+        relpath=path.relative_to(run_dir).as_posix(),
+        bytes=st.st_size,
+        sha256=_sha256_file(path, st),
+    )
 
 
 def write_provenance_bundle(
@@ -236,11 +328,13 @@ def write_provenance_bundle(
 
     Returns: path to provenance.json
     """
+    import platform  # only read once per bundle
+
     run_dir = run_dir.resolve()
     meta_dir = (run_dir / "meta").resolve()
     meta_dir.mkdir(parents=True, exist_ok=True)
 
-    repo_root = _git_repo_root()
+    repo_root, git_sha = _git_root_and_sha()
     lock_path = repo_root / "uv.lock"
     if not lock_path.is_file():
         raise RuntimeError("Missing uv.lock at repo root.Fix:\n  uv lock\n  git add uv.lock\n")
@@ -248,23 +342,26 @@ def write_provenance_bundle(
     # --- pip freeze snapshot ---
     freeze_cmd, freeze_text = _capture_freeze_text(repo_root)
     pip_freeze_path = meta_dir / "pip_freeze.txt"
-    pip_freeze_path.write_text(freeze_text + "\n", encoding="utf-8")
+    write_atomic(pip_freeze_path, (freeze_text + "\n").encode("utf-8"))
 
     # --- manifest ---
     manifest_path = meta_dir / "manifest.json"
-    entries: list[ManifestEntry] = []
-    for p in _iter_manifest_files(run_dir):
-        rel = p.relative_to(run_dir).as_posix()
-        entries.append(ManifestEntry(relpath=rel, bytes=p.stat().st_size, sha256=_sha256_file(p)))
+    files = list(_iter_manifest_files(run_dir))
+    # hashlib releases the GIL while hashing, so files hash concurrently on threads.
+    with ThreadPoolExecutor(max_workers=max(1, min(8, os.cpu_count() or 4, len(files)))) as ex:
+        entries = sorted(
+            ex.map(lambda item: _manifest_entry(run_dir, item), files), key=lambda e: e.relpath
+        )
+
+    # each file is hashed once: the stamp below reuses the manifest's digests
+    shas = {e.relpath: e.sha256 for e in entries}
 
     manifest_obj = {
         "run_dir": str(run_dir),
         "generated_utc": datetime.now(tz=UTC).isoformat(),
         "entries": [e.__dict__ for e in entries],
     }
-    manifest_path.write_text(
-        json.dumps(manifest_obj, indent=2, sort_keys=True) + "\n", encoding="utf-8"
-    )
+    write_atomic(manifest_path, _json_bytes(manifest_obj))
 
     # --- provenance stamp ---
     resolved_cfg = run_dir / "config.resolved.yaml"
@@ -277,7 +374,7 @@ def write_provenance_bundle(
         "schema_version": "v1",
         "created_utc": datetime.now(tz=UTC).isoformat(),
         "git": {
-            "sha": _git_sha(repo_root),
+            "sha": git_sha,
             "dirty": _git_dirty(repo_root),
             "submodules": _git_submodules(repo_root),
         },
@@ -290,7 +387,7 @@ def write_provenance_bundle(
         },
         "config": {
             "resolved_path": str(resolved_cfg.resolve()),
-            "resolved_sha256": _sha256_file(resolved_cfg),
+            "resolved_sha256": shas.get("config.resolved.yaml") or _sha256_file(resolved_cfg),
         },
         "env": {
             "python": sys.version.split()[0],
@@ -302,7 +399,7 @@ def write_provenance_bundle(
             "pip_freeze": {
                 "command": freeze_cmd,
                 "path": str(pip_freeze_path.resolve()),
-                "sha256": _sha256_file(pip_freeze_path),
+                "sha256": shas.get("meta/pip_freeze.txt") or _sha256_file(pip_freeze_path),
             },
             "uv_lock": {
                 "path": str(lock_path.resolve()),
@@ -325,10 +422,7 @@ def write_provenance_bundle(
     prov_path = meta_dir / "provenance.json"
     # Validated before writing:
     validaed = ProvenanceModel.model_validate(prov)
-    prov_path.write_text(
-        json.dumps(validaed.model_dump(mode="json"), indent=2, sort_keys=True) + "\n",
-        encoding="utf-8",
-    )
+    write_atomic(prov_path, _json_bytes(validaed.model_dump(mode="json")))
     return prov_path
 
 
@@ -346,7 +440,7 @@ def validate_provenance_file(path: Path) -> dict[str, Any]:
     path = path.resolve()
     assert path.is_file(), f"Missing provenance file: {path}"
     # Schema validation:
-    validated = ProvenanceModel.model_validate_json(path.read_text(encoding="utf-8"))
+    validated = ProvenanceModel.model_validate_json(path.read_bytes())
     data = validated.model_dump(mode="json")
 
     def req_str(d: dict[str, Any], key: str) -> str:
@@ -374,7 +468,7 @@ def validate_provenance_file(path: Path) -> dict[str, Any]:
     cfg_path = Path(req_str(cfg, "resolved_path"))
     cfg_sha = req_str(cfg, "resolved_sha256")
     assert cfg_path.is_file(), f"resolved config missing: {cfg_path}"
-    assert _sha256_file(cfg_path) == cfg_sha, "resolved config sha256 mismatch"
+    assert _sha256_file_uncached(cfg_path) == cfg_sha, "resolved config sha256 mismatch"
 
     env = req_dict(data, "env")
 
@@ -382,19 +476,19 @@ def validate_provenance_file(path: Path) -> dict[str, Any]:
     lock_path = Path(req_str(lock, "path"))
     lock_sha = req_str(lock, "sha256")
     assert lock_path.is_file(), f"uv.lock missing: {lock_path}"
-    assert _sha256_file(lock_path) == lock_sha, "uv.lock sha256 mismatch"
+    assert _sha256_file_uncached(lock_path) == lock_sha, "uv.lock sha256 mismatch"
 
     freeze = req_dict(env, "pip_freeze")
     freeze_path = Path(req_str(freeze, "path"))
     freeze_sha = req_str(freeze, "sha256")
     assert freeze_path.is_file(), f"pip freeze file missing: {freeze_path}"
-    assert _sha256_file(freeze_path) == freeze_sha, "pip freeze sha256 mismatch"
+    assert _sha256_file_uncached(freeze_path) == freeze_sha, "pip freeze sha256 mismatch"
 
     mani = req_dict(data, "manifest")
     mani_path = Path(req_str(mani, "path"))
     mani_sha = req_str(mani, "sha256")
     assert mani_path.is_file(), f"manifest missing: {mani_path}"
-    assert _sha256_file(mani_path) == mani_sha, "manifest sha256 mismatch"
+    assert _sha256_file_uncached(mani_path) == mani_sha, "manifest sha256 mismatch"
 
     rng = req_dict(data, "rng")
     assert isinstance(rng.get("seed"), int), "rng.seed missing/not int"
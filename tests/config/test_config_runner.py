@@ -6,17 +6,27 @@ Tests:
         -> create run_dir layout -> write config.resolved.yaml
         -> runtime provenance logging
     2) yaml output actually readable.
+    3) memoized file hashing notices rewritten files.
+    4) validation re-hashes from disk (catches same-size, same-mtime rewrites).
+    5) large (mmap'd) files hash correctly.
+    6) orjson and stdlib json write identical meta/ json (when orjson is installed).
+    7) manifest walk finds nested artifacts with their sizes (and skips ckpts).
 
 *This tests: src/config/runner.py , src/provenance.py*
 """
 
 from __future__ import annotations
 
+import hashlib
+import os
 from pathlib import Path
 
+import pytest
 import yaml
 
+import diffusion_core.provenance as provenance
 from diffusion_core.config.runner import run_once
+from diffusion_core.provenance import _sha256_file
 
 
 def test_runner_logic(tmp_path: Path) -> None:
@@ -43,3 +53,93 @@ def test_runner_logic(tmp_path: Path) -> None:
     assert data["seed"] == 7
     assert data["run"]["experiment_name"] == "smoke"
     assert Path(data["run"]["run_root"]).resolve() == run_root.resolve()
+
+
+def test_sha256_memo_tracks_rewrites(tmp_path: Path) -> None:
+    """Same file hashed twice is stable; rewriting it yields the new digest."""
+    p = tmp_path / "blob.txt"
+    p.write_bytes(b"first")
+    assert _sha256_file(p) == hashlib.sha256(b"first").hexdigest()
+    assert _sha256_file(p) == hashlib.sha256(b"first").hexdigest()
+
+    p.write_bytes(b"second!")
+    assert _sha256_file(p) == hashlib.sha256(b"second!").hexdigest()
+
+
+def test_validation_rehashes_same_size_rewrites(tmp_path: Path) -> None:
+    """
+    A same-size rewrite with its mtime restored keeps the memo key (write-side memo is stale
+    by design), so validation hashes from disk and catches the tampered file.
+    """
+    run_root = tmp_path / "run_root"
+    run_root.mkdir()
+    config_path = tmp_path / "smoke.yaml"
+    config_path.write_text("seed: 7\n", encoding="utf-8")
+    run_dir = run_once(
+        config_path=config_path, run_root=run_root, run_id="r0001", argv=["diffusion-core"]
+    )
+    prov = run_dir / "meta" / "provenance.json"
+    provenance.validate_provenance_file(prov)
+
+    freeze = run_dir / "meta" / "pip_freeze.txt"
+    old = freeze.read_bytes()
+    st = freeze.stat()
+    _sha256_file(freeze)  # warm the memo
+    freeze.write_bytes(bytes(b ^ 1 for b in old))  # same size, different content
+    os.utime(freeze, ns=(st.st_atime_ns, st.st_mtime_ns))
+
+    assert _sha256_file(freeze) == hashlib.sha256(old).hexdigest()  # memo can't tell
+    assert (
+        provenance._sha256_file_uncached(freeze) == hashlib.sha256(freeze.read_bytes()).hexdigest()
+    )
+    with pytest.raises(AssertionError, match="pip freeze sha256 mismatch"):
+        provenance.validate_provenance_file(prov)
+
+
+def test_sha256_large_file_matches(tmp_path: Path) -> None:
+    """Files over the mmap threshold hash the same as hashlib does in memory."""
+    data = b"x" * (2 << 20)
+    p = tmp_path / "large.bin"
+    p.write_bytes(data)
+    assert _sha256_file(p) == hashlib.sha256(data).hexdigest()
+
+
+def test_json_bytes_backends_match(monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    With or without orjson, meta/ json bytes are the same for meta/'s value types
+    (str incl. non-ASCII, int, bool, None, containers; floats are not covered).
+    orjson is optional and not in the locked deps, so this is skipped unless it's installed.
+    """
+    pytest.importorskip("orjson")
+    obj = {
+        "b": [1, {"z": None, "a": True}],
+        "a": "x",
+        "run_dir": "/tmp/rüns/✓",
+        "c": {"n": 2**40, "e": []},
+    }
+    fast = provenance._json_bytes(obj)
+    monkeypatch.setattr(provenance, "orjson", None)
+    assert provenance._json_bytes(obj) == fast
+
+
+def test_manifest_files_walk(tmp_path: Path) -> None:
+    """Root files + nested artifacts are listed with sizes; ckpts and dirs are not."""
+    (tmp_path / "artifacts" / "plots" / "deep").mkdir(parents=True)
+    (tmp_path / "ckpts" / "last").mkdir(parents=True)
+    (tmp_path / "logs").mkdir()
+    (tmp_path / "config.resolved.yaml").write_bytes(b"seed: 0\n")
+    (tmp_path / "logs" / "metrics.jsonl").write_bytes(b"")
+    (tmp_path / "artifacts" / "a.txt").write_bytes(b"abc")
+    (tmp_path / "artifacts" / "plots" / "deep" / "b.png").write_bytes(b"12345")
+    (tmp_path / "ckpts" / "last" / "model.pt").write_bytes(b"huge")
+
+    found = {
+        p.relative_to(tmp_path).as_posix(): st.st_size
+        for p, st in provenance._iter_manifest_files(tmp_path)
+    }
+    assert found == {
+        "config.resolved.yaml": 8,
+        "logs/metrics.jsonl": 0,
+        "artifacts/a.txt": 3,
+        "artifacts/plots/deep/b.png": 5,
+    }
@@ -7,6 +7,11 @@ Tests:
     2) unknown nested keys fail validation.
     3) config overrides to a new dir sucessfully
     4) final resolved yaml written and roundtrip sucessful
+    5) empty yaml loads as defaults
+    6) parsed config cache is reused, and invalidated when the yaml changes
+    7) a cache hit picks up changed code defaults (only set fields are cached)
+    8) a corrupt cache entry falls back to the yaml
+    9) resolved json sibling is written and reloads to the same config
 
 *This tests: src/diffusion_core/config/config_utils.py*
 """
@@ -19,7 +24,14 @@ import pytest
 import yaml
 from pydantic import ValidationError
 
-from diffusion_core.config.config_utils import load_config, with_run_root, write_resolved_yaml
+from diffusion_core.config import config_utils
+from diffusion_core.config.config_utils import (
+    _cfg_cache_path,
+    load_config,
+    load_resolved_config,
+    with_run_root,
+    write_resolved_yaml,
+)
 
 
 def test_unknown_top_key_fails(tmp_path: Path) -> None:
@@ -65,3 +77,81 @@ def test_write_resolved_yaml_roundtrip(tmp_path: Path) -> None:
     assert data["seed"] == 7
     assert data["run"]["experiment_name"] == "smoke"
     assert data["run"]["run_root"] == "runs"
+
+
+def test_empty_yaml_loads_defaults(tmp_path: Path) -> None:
+    """An empty (or `null`) yaml falls back to the model defaults."""
+    p = tmp_path / "empty.yaml"
+    p.write_text("", encoding="utf-8")
+    cfg = load_config(p)
+
+    assert cfg.seed == 0
+    assert cfg.run.experiment_name == "smoke"
+
+
+def test_load_config_cache_hit_and_invalidation(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Second load is served from the json cache (no yaml read); editing the yaml busts it."""
+    p = tmp_path / "ok.yaml"
+    p.write_text("seed: 3\nrun:\n  experiment_name: smoke\n", encoding="utf-8")
+    cfg0 = load_config(p)
+
+    cache = _cfg_cache_path(p)
+    assert cache.is_file()
+
+    def _no_yaml(path: Path) -> None:
+        raise AssertionError(f"yaml re-read on a cache hit: {path}")
+
+    with monkeypatch.context() as m:
+        m.setattr(config_utils, "_load_yaml", _no_yaml)
+        assert load_config(p) == cfg0
+
+    p.write_text("seed: 42\nrun:\n  experiment_name: other\n", encoding="utf-8")
+    cfg1 = load_config(p)
+    assert cfg1.seed == 42
+    assert cfg1.run.experiment_name == "other"
+
+
+def test_load_config_cache_takes_new_defaults(tmp_path: Path) -> None:
+    """Defaults aren't frozen into the cache: a changed default shows up on a cache hit."""
+    p = tmp_path / "partial.yaml"
+    p.write_text("seed: 1\n", encoding="utf-8")
+    assert load_config(p).run.experiment_name == "smoke"
+
+    field = config_utils.RunConfig.model_fields["experiment_name"]
+    try:
+        field.default = "changed"
+        config_utils.RunConfig.model_rebuild(force=True)
+        config_utils.AppConfig.model_rebuild(force=True)
+        assert load_config(p).run.experiment_name == "changed"
+    finally:
+        field.default = "smoke"
+        config_utils.RunConfig.model_rebuild(force=True)
+        config_utils.AppConfig.model_rebuild(force=True)
+
+
+def test_load_config_corrupt_cache_falls_back(tmp_path: Path) -> None:
+    """A cache entry with a matching key but bad body is ignored (yaml is re-read)."""
+    p = tmp_path / "ok.yaml"
+    p.write_text("seed: 5\nrun:\n  experiment_name: smoke\n", encoding="utf-8")
+    load_config(p)
+
+    cache = _cfg_cache_path(p)
+    header = cache.read_bytes().split(b"\n", 1)[0]
+    cache.write_bytes(header + b"\n{not json")
+
+    assert load_config(p).seed == 5
+
+
+def test_resolved_json_reload(tmp_path: Path) -> None:
+    """write_resolved_yaml also writes config.resolved.json, which reloads losslessly."""
+    p = tmp_path / "ok.yaml"
+    p.write_text("seed: 7\nrun:\n  experiment_name: smoke\n", encoding="utf-8")
+    cfg = with_run_root(load_config(p), tmp_path / "runs")
+
+    out = tmp_path / "config.resolved.yaml"
+    write_resolved_yaml(cfg, out)
+
+    assert (tmp_path / "config.resolved.json").is_file()
+    assert load_resolved_config(out) == cfg
@@ -5,6 +5,10 @@ Tests:
     create_run_dir:
     1) layout resolves as expected.
     2) Failure if run_dir already exists when attempted.
+    3) experiment names are sanitized for the run dir name.
+    4) metrics.jsonl gets the same umask-derived mode as other run files.
+    write_atomic:
+    5) (over)writes the full payload and leaves no temp files behind.
 
 
 *This tests: src/diffusion_core/config/run_layout.py*
@@ -12,11 +16,14 @@ Tests:
 
 from __future__ import annotations
 
+import os
+import stat
+import sys
 from pathlib import Path
 
 import pytest
 
-from diffusion_core.config.run_layout import create_run_dir
+from diffusion_core.config.run_layout import create_run_dir, write_atomic
 
 
 def test_creates_expected_layout(tmp_path: Path) -> None:
@@ -43,3 +50,44 @@ def test_fails_if_run_dir_already_exists(tmp_path: Path) -> None:
     _ = create_run_dir(run_root, "smoke", run_id="r0001")
     with pytest.raises(FileExistsError):
         _ = create_run_dir(run_root, "smoke", run_id="r0001")
+
+
+def test_experiment_name_is_sanitized(tmp_path: Path) -> None:
+    """Unsafe characters become '-', edges are stripped, empty names fall back to 'run'."""
+    run_root = tmp_path / "runs"
+    run_root.mkdir()
+
+    assert create_run_dir(run_root, "my exp/v1.2", run_id="r1").run_dir.name == "r1_my-exp-v1-2"
+    assert create_run_dir(run_root, "__ünï_cödé__", run_id="r2").run_dir.name == "r2___ünï_cödé__"
+    assert create_run_dir(run_root, "///", run_id="r3").run_dir.name == "r3_run"
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="POSIX permission bits")
+def test_metrics_file_mode_follows_umask(tmp_path: Path) -> None:
+    """With umask 002, metrics.jsonl is 664 like a file written via write_atomic."""
+    run_root = tmp_path / "runs"
+    run_root.mkdir()
+
+    old_umask = os.umask(0o002)
+    try:
+        paths = create_run_dir(run_root, "smoke", run_id="r0001")
+        other = paths.run_dir / "meta" / "other.txt"
+        write_atomic(other, b"x")
+    finally:
+        os.umask(old_umask)
+
+    def mode(p: Path) -> int:
+        return stat.S_IMODE(p.stat().st_mode)
+
+    assert mode(paths.run_dir / "logs" / "metrics.jsonl") == 0o664
+    assert mode(paths.run_dir / "logs" / "metrics.jsonl") == mode(other)
+
+
+def test_write_atomic_replaces_without_leftovers(tmp_path: Path) -> None:
+    """Atomic writes create or replace the file and clean up their temp sibling."""
+    out = tmp_path / "provenance.json"
+    write_atomic(out, b"old")
+    write_atomic(out, b"new payload")
+
+    assert out.read_bytes() == b"new payload"
+    assert [p.name for p in tmp_path.iterdir()] == ["provenance.json"]
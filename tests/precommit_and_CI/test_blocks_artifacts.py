@@ -1,16 +1,27 @@
 """
 Unit tests for blocking artifacts.
 
-Tests two cases:
+Tests:
     1) Artifacts too large don't go through.
     2) Correctly size artifacts do.
+    3) Every file under a forbidden dir is reported (in order), nothing else is.
+    4) Git listings stream verbatim names, and git failures raise RuntimeError
+       (even after git floods stderr: no pipe deadlock).
+    5) The extension check agrees with PurePath.suffix (case, dotfiles, multi-dot names).
+    6) Threaded size checks (--jobs) report the same violations, in the same order,
+       and keep only a bounded window of checks in flight (the listing still streams).
 
 
 This is testing: tools/blocks_artifacts.py
 """
 
-from pathlib import Path
+import os
+import subprocess
+import sys
+import threading
+from pathlib import Path, PurePath
 
+import pytest
 import tools.blocks_artifacts as ba
 
 
@@ -40,3 +51,141 @@ def test_rejects_over_20mb_file(tmp_path: Path):
     assert len(violations) == 1
     assert violations[0].path == str(p)
     assert "file too large" in violations[0].reason.lower()
+
+
+def test_reports_each_file_under_forbidden_dirs():
+    """Forbidden dir segments flag every file below them; lookalike names don't."""
+    paths = [
+        "src/data/a.py",
+        "src/data/deep/b.py",
+        "src/data_utils.py",  # not a forbidden segment
+        "runs/x/y.txt",
+        "src/data/c.py",
+        "src/database/d.py",  # not a forbidden segment
+    ]
+    violations = ba.scan_paths(paths)
+    assert [v.path for v in violations] == [
+        "src/data/a.py",
+        "src/data/deep/b.py",
+        "runs/x/y.txt",
+        "src/data/c.py",
+    ]
+    assert violations[1].reason == "forbidden directory segment 'data/'"
+    assert violations[2].reason == "forbidden directory segment 'runs/'"
+
+
+def test_streams_git_listing(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    """Staged names arrive as a lazy stream, odd characters intact; no repo -> RuntimeError."""
+    names = ["a b.txt", "dir/ü.py", "new\nline.txt"]
+    for name in names:
+        (tmp_path / name).parent.mkdir(parents=True, exist_ok=True)
+        (tmp_path / name).write_text("x\n", encoding="utf-8")
+    subprocess.run(["git", "init", "-q"], cwd=tmp_path, check=True)
+    subprocess.run(["git", "add", "--", *names], cwd=tmp_path, check=True)
+    monkeypatch.chdir(tmp_path)
+
+    staged = ba._list_staged_files()
+    assert iter(staged) is staged  # not a materialized list
+    assert sorted(staged) == sorted(names)
+
+    monkeypatch.chdir(tmp_path / "dir")
+    monkeypatch.setenv("GIT_DIR", str(tmp_path / "missing.git"))
+    with pytest.raises(RuntimeError, match="git command failed"):
+        list(ba._list_repo_files())
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="fake git is a POSIX shell script")
+def test_stream_git_survives_stderr_flood(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    """Git writing more than a pipe buffer of stderr before stdout doesn't hang the reader."""
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    fake_git = bin_dir / "git"
+    fake_git.write_text(
+        "#!/bin/sh\n"
+        "head -c 262144 /dev/zero | tr '\\0' e >&2\n"  # 256 KiB, several pipe buffers
+        "printf 'a.txt\\0b.txt\\0'\n"
+        "exit 1\n",
+        encoding="utf-8",
+    )
+    fake_git.chmod(0o755)
+    monkeypatch.setenv("PATH", f"{bin_dir}{os.pathsep}{os.environ['PATH']}")
+
+    result: dict[str, object] = {}
+
+    def consume() -> None:
+        got: list[str] = []
+        try:
+            for name in ba._list_repo_files():
+                got.append(name)
+        except RuntimeError as e:
+            result["error"] = e
+        result["names"] = got
+
+    t = threading.Thread(target=consume, daemon=True)
+    t.start()
+    t.join(timeout=30)
+    assert not t.is_alive(), "reader deadlocked on git's stderr"
+    assert result["names"] == ["a.txt", "b.txt"]
+    assert "git command failed" in str(result["error"])
+    assert "eeee" in str(result["error"])
+
+
+@pytest.mark.parametrize(
+    "name",
+    ["w.pt", "W.PT", "a.tar.gz", "a..gz", "x/.gz", ".npy", "a.gz.txt", "a.", "dir.pt/x", "c.pkl2"],
+)
+def test_forbidden_ext_matches_suffix_semantics(name: str):
+    """Flags exactly what PurePath(name).suffix.lower() would."""
+    suffix = PurePath(name).suffix.lower()
+    bad, reason = ba._is_forbidden_ext(name)
+    assert bad is (suffix in ba.FORBIDDEN_EXTS)
+    assert reason == (f"forbidden extension '{suffix}'" if bad else "")
+
+
+def test_parallel_size_checks_keep_order(tmp_path: Path):
+    """jobs > 1 interleaves size and name violations exactly like the serial scan."""
+    paths = []
+    for i in range(8):
+        p = tmp_path / f"f{i}.dat"
+        if i % 3 == 0:
+            _make_sparse_file(p, 2048)
+        else:
+            p.write_bytes(b"x")
+        paths.append(str(p))
+    paths[4:4] = ["runs/a.txt", "w.pt", str(tmp_path / "missing.dat")]
+
+    serial = ba.scan_paths(paths, max_bytes=1024)
+    assert [v.path for v in serial] == [
+        paths[0],
+        paths[3],
+        "runs/a.txt",
+        "w.pt",
+        paths[9],
+    ]
+    assert ba.scan_paths(paths, max_bytes=1024, jobs=4) == serial
+
+
+def test_parallel_size_checks_stay_bounded(monkeypatch: pytest.MonkeyPatch):
+    """Paths are pulled lazily: submitting more waits for the oldest size checks first."""
+    jobs = 2
+    window = ba.SIZE_CHECKS_IN_FLIGHT_PER_JOB * jobs
+    done = 0
+    lock = threading.Lock()
+
+    def fake_size_check(path_str: str, max_bytes: int) -> tuple[bool, str]:
+        nonlocal done
+        with lock:
+            done += 1
+        return False, ""
+
+    monkeypatch.setattr(ba, "_is_too_large_path", fake_size_check)
+
+    def paths():
+        for k in range(200):
+            with lock:
+                # items 0..k-1 were submitted; at most `window` of them may be unfinished
+                assert done >= k - window - 1, (k, done)
+            yield f"src/f{k}.py"
+
+    assert ba.scan_paths(paths(), jobs=jobs) == []
+    assert done == 200
@@ -3,15 +3,22 @@ Unit test for docstring enforcement.
 
 Tests:
     1) Imports repo sucessfully and runs without error.
+    2) Token fast path for module docstrings agrees with the AST check.
+    3) Pooled checks report the same violations, in task order, as serial ones.
+    4) Pruned cached trees still carry module, def and class docstrings.
 
 
 *This is testing: tools/enforce_docstrings.py*
 """
 
+import ast
 import subprocess
 import sys
 from pathlib import Path
 
+import pytest
+import tools.enforce_docstrings as ed
+
 
 def test_repo_import_and_docstring_checker_runs(repo_root: Path):
     """
@@ -37,3 +44,71 @@ def test_repo_import_and_docstring_checker_runs(repo_root: Path):
         f"stdout:\n{result.stdout}\n"
         f"stderr:\n{result.stderr}\n"
     )
+
+
+@pytest.mark.parametrize(
+    "src",
+    [
+        '"""Doc."""\nx = 1\n',
+        "#!/usr/bin/env python\n# comment\n\n'doc'\n",
+        '"a" "b"\n',
+        "''\n",
+        'b"bytes"\n',
+        '"a" + b\n',
+        "import os\n'late'\n",
+        '("wrapped")\n',
+        "",
+    ],
+)
+def test_fast_module_docstring_matches_ast(tmp_path: Path, src: str):
+    """
+    Fast path may only claim a docstring the AST agrees on; the final verdict is identical.
+    """
+    path = tmp_path / "mod.py"
+    path.write_text(src, encoding="utf-8")
+    expected = bool(ast.get_docstring(ast.parse(src)))
+
+    assert not ed._has_module_docstring_fast(path) or expected
+    assert (not ed.check_core_module(path)) is expected
+
+
+def test_run_checks_pool_keeps_task_order(tmp_path: Path):
+    """
+    Enough tasks to take the process-pool path; violations come back in task order.
+    """
+    tasks = []
+    for i in range(ed.POOL_MIN_TASKS + 2):
+        path = tmp_path / f"m{i}.py"
+        path.write_text("x = 1\n" if i % 2 else '"""Doc."""\n', encoding="utf-8")
+        tasks.append(("core", path, tmp_path))
+
+    pooled = ed.run_checks(tasks)
+
+    assert pooled == [vio for t in tasks for vio in ed._dispatch(t)]
+    assert [vio.path.name for vio in pooled] == ["m1.py", "m3.py", "m5.py"]
+
+
+def test_pruned_tree_keeps_docstrings(tmp_path: Path):
+    """
+    Bodies are trimmed to the docstring slot; the api check's verdicts are unaffected.
+    """
+    path = tmp_path / "api_mod.py"
+    path.write_text(
+        '"""Module doc."""\n'
+        "import os\n"
+        "def documented():\n"
+        '    """Doc."""\n'
+        "    return os.sep\n"
+        "class Bare:\n"
+        "    def method(self):\n"
+        '        """Nested docs do not count."""\n',
+        encoding="utf-8",
+    )
+
+    tree = ed.parse_py(path)
+
+    assert all(len(n.body) == 1 for n in ed.top_level_defs(tree))
+    assert not any(isinstance(n, ast.Import) for n in tree.body)
+    assert [(v.lineno, v.message) for v in ed.check_api_file(path)] == [
+        (6, "Public symbol 'Bare' is missing a docstring.")
+    ]
@@ -6,6 +6,12 @@ Tests:
     2) commit is blocked if on the main branch
     3) commit is blocked if on a detached HEAD.
     4) commit is blocked if on a stale ref/deleted branch (passes otherwise)
+    5) --no-fetch checks against the local origin/main without the network
+    6) a recent successful fetch is reused (no fetch within the TTL)
+    7) refs read from git-dir files match git (loose, packed, linked worktree)
+    8) branch / detached HEAD are read from files; the fast path runs without git at all
+    9) a fetch marker dated in the future doesn't count as fresh
+    10) a missing origin/main is reported as local-only when no fetch ran
 
 This is testing: tools/precommit_guard.py
 """
@@ -17,6 +23,8 @@ import subprocess
 import sys
 from pathlib import Path
 
+import tools.precommit_guard as pg
+
 
 def find_repo_root(start: Path) -> Path:
     start = start.resolve()
@@ -88,8 +96,8 @@ def setup_repo_with_origin(tmp_path: Path) -> tuple[Path, Path]:
     return repo, remote
 
 
-def run_guard(cwd: Path) -> tuple[int, str]:
-    return run([sys.executable, str(SCRIPT)], cwd=cwd)
+def run_guard(cwd: Path, *args: str) -> tuple[int, str]:
+    return run([sys.executable, str(SCRIPT), *args], cwd=cwd)
 
 
 def test_not_a_git_repo(tmp_path: Path) -> None:
@@ -142,3 +150,109 @@ def test_blocks_stale_branch_and_passes_when_fresh(tmp_path: Path) -> None:
 
     rc, out = run_guard(repo)
     assert rc == 0, out
+
+
+def test_no_fetch_skips_network(tmp_path: Path) -> None:
+    repo, _ = setup_repo_with_origin(tmp_path)
+    git(repo, "checkout", "-b", "chore/feat")
+    git(repo, "remote", "set-url", "origin", str(tmp_path / "missing.git"))
+
+    rc, out = run_guard(repo)
+    assert rc == 1
+    assert "failed to fetch" in out
+
+    rc, out = run_guard(repo, "--no-fetch")
+    assert rc == 0, out
+
+
+def test_recent_fetch_is_reused(tmp_path: Path) -> None:
+    repo, _ = setup_repo_with_origin(tmp_path)
+    git(repo, "checkout", "-b", "chore/feat")
+
+    rc, out = run_guard(repo)
+    assert rc == 0, out
+
+    # origin unreachable now, but the fetch a moment ago is still within the TTL.
+    git(repo, "remote", "set-url", "origin", str(tmp_path / "missing.git"))
+    rc, out = run_guard(repo)
+    assert rc == 0, out
+
+
+def test_read_ref_matches_git(tmp_path: Path) -> None:
+    repo, _ = setup_repo_with_origin(tmp_path)
+    git(repo, "checkout", "-b", "chore/feat")
+    commit(repo, "feat", fname="feat.txt")
+    _, head = git(repo, "rev-parse", "HEAD")
+    _, origin_main = git(repo, "rev-parse", "origin/main")
+    git_dir = repo / ".git"
+
+    assert pg._read_ref(git_dir, "HEAD") == head
+    assert pg._read_ref(git_dir, "refs/remotes/origin/main") == origin_main
+
+    git(repo, "pack-refs", "--all")
+    assert pg._read_ref(git_dir, "HEAD") == head
+    assert pg._read_ref(git_dir, "refs/remotes/origin/main") == origin_main
+    assert pg._read_ref(git_dir, "refs/heads/missing") is None
+
+    wt = tmp_path / "wt"
+    git(repo, "worktree", "add", "-b", "chore/wt", str(wt), "origin/main")
+    _, wt_git_dir = git(wt, "rev-parse", "--absolute-git-dir")
+    assert pg._read_ref(Path(wt_git_dir), "HEAD") == origin_main
+    assert pg._read_ref(Path(wt_git_dir), "refs/remotes/origin/main") == origin_main
+
+    # at the origin/main tip: passes on the file fast path
+    rc, out = run_guard(wt, "--no-fetch")
+    assert rc == 0, out
+
+
+def test_read_head_without_git(tmp_path: Path) -> None:
+    repo, _ = setup_repo_with_origin(tmp_path)
+    git(repo, "checkout", "-b", "chore/feat")
+    git_dir = repo / ".git"
+    assert pg._read_head(git_dir) == ("chore/feat", None)
+
+    # no git on PATH: branch, refs and the HEAD == origin/main shortcut are all file reads
+    env = {**os.environ, "PATH": str(tmp_path / "no-bin")}
+    p = subprocess.run(
+        [sys.executable, str(SCRIPT), "--no-fetch"],
+        cwd=repo,
+        env=env,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True,
+    )
+    assert p.returncode == 0, p.stdout
+
+    _, head = git(repo, "rev-parse", "HEAD")
+    git(repo, "checkout", head)
+    assert pg._read_head(git_dir) == ("HEAD", head)
+
+    git(repo, "checkout", "--orphan", "chore/unborn")
+    assert pg._read_head(git_dir) == (None, None)  # left to git
+
+
+def test_future_fetch_marker_is_not_fresh(tmp_path: Path) -> None:
+    repo, _ = setup_repo_with_origin(tmp_path)
+    git(repo, "checkout", "-b", "chore/feat")
+    marker = repo / ".git" / pg.FETCH_MARKER
+    marker.touch()
+    future = marker.stat().st_mtime + 3600  # clock skew / NFS
+    os.utime(marker, (future, future))
+
+    # unreachable origin: a marker treated as fresh would skip the fetch and pass.
+    git(repo, "remote", "set-url", "origin", str(tmp_path / "missing.git"))
+    rc, out = run_guard(repo)
+    assert rc == 1
+    assert "failed to fetch" in out
+
+
+def test_missing_origin_main_without_fetch(tmp_path: Path) -> None:
+    repo, _ = setup_repo_with_origin(tmp_path)
+    git(repo, "checkout", "-b", "chore/feat")
+    commit(repo, "feat", fname="feat.txt")
+    git(repo, "update-ref", "-d", "refs/remotes/origin/main")
+
+    rc, out = run_guard(repo, "--no-fetch")
+    assert rc == 1
+    assert "not found locally" in out
+    assert "after fetch" not in out
@@ -2,7 +2,8 @@
 Integration test for CLI.
 
 Tests:
-    1) CLI runs and returns output matched to basic expectaions.
+    1) CLI runs (in-process, via main()) and returns output matched to basic expectaions.
+    2) The real `python -m diffusion_core.cli` entrypoint does the same (subprocess, slower).
 
 
 *This tests: src/diffusion_core/cli.py*
@@ -15,6 +16,9 @@ import subprocess
 import sys
 from pathlib import Path
 
+import pytest
+
+from diffusion_core.cli import main
 from diffusion_core.provenance import validate_provenance_file
 
 
@@ -26,22 +30,15 @@ def _extract_run_dir(out: str) -> Path:
     return Path(m.group(1)).expanduser().resolve()
 
 
-def test_cli_integration(tmp_path: Path) -> None:
-    """
-    Creates run_dir, then expands run_dir in a check for expectations.
-    """
-
-    # Minimal config file (kept inside tmp.)
+def _smoke_args(tmp_path: Path) -> list[str]:
+    """Minimal config file + run root (kept inside tmp), as `smoke` CLI args."""
     cfg = tmp_path / "smoke.yaml"
     cfg.write_text("seed: 0\nrun:\n  experiment_name: smoke\n", encoding="utf-8")
 
     run_root = tmp_path / "runs"
     run_root.mkdir()
 
-    cmd = [
-        sys.executable,
-        "-m",
-        "diffusion_core.cli",
+    return [
         "smoke",
         "--config",
         str(cfg),
@@ -51,19 +48,9 @@ def test_cli_integration(tmp_path: Path) -> None:
         "r0001",  # stable run_id for test (and avoids randomness in assertions)
     ]
 
-    p = subprocess.run(
-        cmd,
-        stdout=subprocess.PIPE,
-        stderr=subprocess.STDOUT,
-        text=True,
-        timeout=30,
-        check=False,
-    )
-
-    assert p.returncode == 0, f"CLI smoke failed\n\nOUT:\n{p.stdout}"
-
-    run_dir = _extract_run_dir(p.stdout)
 
+def _check_run_dir(run_dir: Path) -> None:
+    """Provenance + expected outputs of a smoke run."""
     # provenance checks:
     prov = run_dir / "meta" / "provenance.json"
     validate_provenance_file(prov)
@@ -74,3 +61,40 @@ def test_cli_integration(tmp_path: Path) -> None:
     assert (run_dir / "logs" / "metrics.jsonl").is_file()
     assert (run_dir / "ckpts" / "last").is_dir()
     assert (run_dir / "artifacts").is_dir()
+
+
+def test_cli_integration(
+    tmp_path: Path, capsys: pytest.CaptureFixture[str], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """
+    Creates run_dir through main() in-process (no interpreter start-up per test),
+    then expands run_dir in a check for expectations.
+    """
+    args = _smoke_args(tmp_path)
+    # provenance records sys.argv as the invocation; make it look like the real CLI.
+    monkeypatch.setattr(sys, "argv", ["diffusion-core", *args])
+
+    assert main(args) == 0
+
+    _check_run_dir(_extract_run_dir(capsys.readouterr().out))
+
+
+@pytest.mark.integration
+def test_cli_subprocess_smoke(tmp_path: Path) -> None:
+    """
+    Same run through the real `-m diffusion_core.cli` entrypoint in a fresh interpreter.
+    """
+    cmd = [sys.executable, "-m", "diffusion_core.cli", *_smoke_args(tmp_path)]
+
+    p = subprocess.run(
+        cmd,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True,
+        timeout=30,
+        check=False,
+    )
+
+    assert p.returncode == 0, f"CLI smoke failed\n\nOUT:\n{p.stdout}"
+
+    _check_run_dir(_extract_run_dir(p.stdout))
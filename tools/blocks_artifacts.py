@@ -22,53 +22,63 @@ Tested by: tests/test_blocks_artifacts.py
 from __future__ import annotations
 
 import argparse
+import bisect
+import itertools
+import os
 import subprocess
 import sys
-from collections.abc import Iterable
+import tempfile
+from collections import deque
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import nullcontext
 from dataclasses import dataclass
-from pathlib import Path
 
 # The below are similar to gitingore and
 # will be updated if there's another convenient dir to gitingore later
 # or another extension 'should be ingored' occurence.
-FORBIDDEN_DIR_NAMES = {
-    "runs",
-    "run",
-    "checkpoints",
-    "checkpoint",
-    "ckpts",
-    "ckpt",
-    "data",
-    "dataset",
-    "datasets",
-    "caches",
-    "cache",
-    ".cache",
-    "wandb",
-    "lightning_logs",
-}
-
-FORBIDDEN_EXTS = {
-    # checkpoints / weights
-    ".pt",
-    ".pth",
-    ".ckpt",
-    ".safetensors",
-    ".onnx",
-    # binary blobs
-    ".npz",
-    ".npy",
-    ".pkl",
-    ".pickle",
-    ".joblib",
-    # archives
-    ".zip",
-    ".tar",
-    ".tgz",
-    ".gz",
-    ".7z",
-    ".rar",
-}
+FORBIDDEN_DIR_NAMES: frozenset[str] = frozenset(
+    {
+        "runs",
+        "run",
+        "checkpoints",
+        "checkpoint",
+        "ckpts",
+        "ckpt",
+        "data",
+        "dataset",
+        "datasets",
+        "caches",
+        "cache",
+        ".cache",
+        "wandb",
+        "lightning_logs",
+    }
+)
+
+FORBIDDEN_EXTS: frozenset[str] = frozenset(
+    {
+        # checkpoints / weights
+        ".pt",
+        ".pth",
+        ".ckpt",
+        ".safetensors",
+        ".onnx",
+        # binary blobs
+        ".npz",
+        ".npy",
+        ".pkl",
+        ".pickle",
+        ".joblib",
+        # archives
+        ".zip",
+        ".tar",
+        ".tgz",
+        ".gz",
+        ".7z",
+        ".rar",
+    }
+)
 
 DEFAULT_MAX_BYTES = 20 * 1024 * 1024  # 20 MB (extra safety net)
 
@@ -79,118 +89,214 @@ class Violation:
     reason: str
 
 
-def _run_git(args: list[str]) -> str:
+def _stream_git(args: list[str]) -> Iterator[str]:
     """
-    Initalize and call in subprocess.
+    Runs git and yields its NUL-separated (-z) records as they arrive, never holding
+    the whole listing. Raises RuntimeError once the output is drained if git failed.
+    stderr goes to a temp file, not a pipe: an unread stderr pipe filling up while
+    stdout is still being read would block git (and the hook) forever.
     """
-    try:
-        out = subprocess.check_output(["git", *args], stderr=subprocess.STDOUT)
-        return out.decode("utf-8", errors="replace")
-    except subprocess.CalledProcessError as e:
-        msg = e.output.decode("utf-8", errors="replace")
-        raise RuntimeError(f"git command failed: git {' '.join(args)}\n{msg}") from e
-
-
-def _list_staged_files() -> list[str]:
+    with tempfile.TemporaryFile() as err_file:
+        proc = subprocess.Popen(["git", *args], stdout=subprocess.PIPE, stderr=err_file)
+        assert proc.stdout is not None
+        fd = proc.stdout.fileno()  # raw reads: whatever the pipe holds, up to 64 KiB
+        try:
+            tail = b""
+            while chunk := os.read(fd, 1 << 16):
+                *records, tail = (tail + chunk).split(b"\0")
+                for rec in records:
+                    if rec:
+                        yield rec.decode("utf-8", errors="replace")
+            if tail:
+                yield tail.decode("utf-8", errors="replace")
+            if proc.wait() != 0:
+                err_file.seek(0)
+                err = err_file.read().decode("utf-8", errors="replace")
+                raise RuntimeError(f"git command failed: git {' '.join(args)}\n{err}")
+        finally:
+            # Also runs if the consumer stops early: don't leave git blocked on a full pipe.
+            if proc.poll() is None:
+                proc.kill()
+            proc.stdout.close()
+            proc.wait()
+
+
+def _list_staged_files() -> Iterator[str]:
     """
     Include:
         A(dd), C(opy), M(odify), R(ename),
         T(type), U(unmerged), X(unknown), B(broken)
     in this list.
     """
-    out = _run_git(["diff", "--cached", "--name-only", "--diff-filter=ACMRTUXB"])
-    files = [line.strip() for line in out.splitlines() if line.strip()]
-    return files
+    return _stream_git(["diff", "--cached", "--name-only", "-z", "--diff-filter=ACMRTUXB"])
 
 
-def _list_repo_files() -> list[str]:
+def _list_repo_files() -> Iterator[str]:
     """
     Use git ls-files to avoid scanning ignored/untracked junk,
     But still catch tracked forbidden files.
+    (-z: NUL-separated, never quoted, so odd file names come through verbatim.)
     """
-    out = _run_git(["ls-files"])
-    files = [line.strip() for line in out.splitlines() if line.strip()]
-    return files
+    return _stream_git(["ls-files", "-z"])
 
 
-def _is_under_forbidden_dir(path: Path) -> tuple[bool, str]:
+def _is_under_forbidden_dir(rel: str) -> tuple[bool, str]:
     """
-    Recurses over dirs's parts to find if under forbidden dir.
+    Walks the path's "/"-separated segments to find if under forbidden dir
+    (plain str.split: git always emits POSIX paths, no pathlib parsing needed).
     Returns tuple with this bool + str (message).
     """
-    parts = [p for p in path.parts if p not in (".", "")]
-    for p in parts:
-        if p in FORBIDDEN_DIR_NAMES:
-            return True, f"forbidden directory segment '{p}/'"
+    # "" segments (leading "/", "//") can never be forbidden names, so no need to filter.
+    for seg in rel.split("/"):
+        if seg in FORBIDDEN_DIR_NAMES:
+            return True, f"forbidden directory segment '{seg}/'"
     return False, ""
 
 
-def _is_forbidden_ext(path: Path) -> tuple[bool, str]:
+def _is_forbidden_ext(name: str) -> tuple[bool, str]:
     """
     Checks file suffix for forbidden extensions.
+    Two rpartitions (C string ops) with PurePath.suffix semantics:
+    last "."-part of the final segment; a bare dotfile such as "dir/.gz" has no suffix.
     Returns tuple with this bool + str (message).
     """
-    suf = path.suffix.lower()
+    stem, _, ext = name.rpartition("/")[2].rpartition(".")
+    if not stem:
+        return False, ""
+    suf = "." + ext.lower()
     if suf in FORBIDDEN_EXTS:
         return True, f"forbidden extension '{suf}'"
     return False, ""
 
 
-def _is_too_large(path: Path, max_bytes: int) -> tuple[bool, str]:
+def _is_too_large(size: int, max_bytes: int) -> tuple[bool, str]:
     """
     if size > max_bytes: (True, False)
     Returns tuple with this bool + str (message).
     """
+    if size > max_bytes:
+        return True, f"file too large ({size} bytes > {max_bytes} bytes)"
+    return False, ""
+
+
+def _is_too_large_path(path_str: str, max_bytes: int) -> tuple[bool, str]:
+    """
+    _is_too_large for a path: one lstat (a symlink is judged by itself, as git stores it,
+    never by its target).
+    """
     try:
-        size = path.stat().st_size
+        size = os.lstat(path_str).st_size
     except FileNotFoundError:
         # Renames/deletes can appear in staged lists; ignore missing.
         return False, ""
-    if size > max_bytes:
-        return True, f"file too large ({size} bytes > {max_bytes} bytes)"
-    return False, ""
+    return _is_too_large(size, max_bytes)
 
 
-def _check_paths(paths: Iterable[str], max_bytes: int) -> list[Violation]:
+def _name_reason(p: str) -> str | None:
+    """
+    Violation reason from the name alone (dir segments, extension), or None.
+    Pure string work; the size check (the only one touching the filesystem) runs only
+    if this passes.
+    """
+    bad_dir, dir_reason = _is_under_forbidden_dir(p)
+    if bad_dir:
+        return dir_reason
+
+    bad_ext, ext_reason = _is_forbidden_ext(p)
+    if bad_ext:
+        return ext_reason
+    return None
+
+
+def _forbidden_dir_prefix(p: str) -> str | None:
+    """
+    "a/data/b/x.py" -> "a/data/" (up to and incl. the first forbidden segment), else None.
+    Only meaningful for "/"-separated paths (what git emits).
+    """
+    head = ""
+    for seg in p.split("/"):
+        head += seg + "/"
+        if seg in FORBIDDEN_DIR_NAMES:
+            return head
+    return None
+
+
+# Size checks queued per --jobs thread: enough to keep the threads busy, small enough that
+# a repo-mode scan stays streaming.
+SIZE_CHECKS_IN_FLIGHT_PER_JOB = 4
+
+
+def _check_paths(paths: Iterable[str], max_bytes: int, jobs: int = 1) -> list[Violation]:
     """
     High level violation checker, checks for:
         .git files (skips)
         Forbidden dirs it recognizes (important, gitingored files can still be added with -f)
         Forbidden extensions
         Files over 20 mb.
-    """
-    violations: list[Violation] = []
-    for p in paths:
-        # Normalize to forward slashes for output readability
-        rel = Path(p)
-        if rel.parts and rel.parts[0] == ".git":
-            continue
-
-        bad_dir, dir_reason = _is_under_forbidden_dir(rel)
-        if bad_dir:
-            violations.append(Violation(p, dir_reason))
-            continue
-
-        bad_ext, ext_reason = _is_forbidden_ext(rel)
-        if bad_ext:
-            violations.append(Violation(p, ext_reason))
-            continue
-
-        # Size check only if the file exists in working tree
-        bad_size, size_reason = _is_too_large(rel, max_bytes=max_bytes)
-        if bad_size:
-            violations.append(Violation(p, size_reason))
-            continue
 
-    return violations
+    Dirs already found forbidden are remembered as sorted prefixes: any later path under
+    one is matched by a single bisect + startswith instead of re-checking every segment.
+    (No prefix can extend another, so the nearest one below `p` is the only candidate.)
 
+    jobs > 1: name checks stay serial, size checks (lstat, I/O-bound; slow on network
+    filesystems) go to a thread pool as paths stream in. At most
+    SIZE_CHECKS_IN_FLIGHT_PER_JOB * jobs are outstanding (oldest collected first), so the
+    listing is still never held in memory. Violations keep input order.
+    """
+    found: list[tuple[int, Violation]] = []
+    pending: deque[tuple[int, str, Future[tuple[bool, str]]]] = deque()
+    max_in_flight = SIZE_CHECKS_IN_FLIGHT_PER_JOB * jobs
 
-def scan_paths(paths, max_bytes: int = DEFAULT_MAX_BYTES):
+    def collect_oldest() -> None:
+        n, p, fut = pending.popleft()
+        bad_size, size_reason = fut.result()
+        if bad_size:
+            found.append((n, Violation(p, size_reason)))
+
+    prefixes: list[str] = []
+    prefix_reasons: dict[str, str] = {}
+    with ThreadPoolExecutor(max_workers=jobs) if jobs > 1 else nullcontext() as ex:
+        for n, p in enumerate(paths):
+            i = bisect.bisect_right(prefixes, p)
+            if i and p.startswith(prefixes[i - 1]):
+                found.append((n, Violation(p, prefix_reasons[prefixes[i - 1]])))
+                continue
+
+            if p == ".git" or p.startswith(".git/"):
+                continue
+
+            reason = _name_reason(p)
+            if reason is None:
+                # Size check only if the file exists in working tree
+                if ex is not None:
+                    pending.append((n, p, ex.submit(_is_too_large_path, p, max_bytes)))
+                    if len(pending) > max_in_flight:
+                        collect_oldest()
+                    continue
+                bad_size, size_reason = _is_too_large_path(p, max_bytes=max_bytes)
+                if bad_size:
+                    found.append((n, Violation(p, size_reason)))
+                continue
+
+            found.append((n, Violation(p, reason)))
+            prefix = _forbidden_dir_prefix(p)
+            if prefix is not None and prefix != p + "/":  # a dir, not the file itself
+                bisect.insort(prefixes, prefix)
+                prefix_reasons[prefix] = reason
+
+        while pending:
+            collect_oldest()
+    if jobs > 1:  # size violations were collected late; restore input order
+        found.sort(key=lambda item: item[0])
+    return [v for _, v in found]
+
+
+def scan_paths(paths, max_bytes: int = DEFAULT_MAX_BYTES, jobs: int = 1):
     """
     Pure scan (no git). Useful for unit tests.
     Returns a list of Violation objects.
     """
-    return _check_paths(paths, max_bytes=max_bytes)
+    return _check_paths(paths, max_bytes=max_bytes, jobs=jobs)
 
 
 def main() -> int:
@@ -207,25 +313,36 @@ def main() -> int:
         default=DEFAULT_MAX_BYTES,
         help="Fail if any file exceeds this size (extra safety net).",
     )
+    ap.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Threads for the file size checks (helps on network filesystems); 1 = serial.",
+    )
     args = ap.parse_args()
 
+    # Listings are streamed, so git failures surface while the paths are being checked.
     try:
         mode = args.mode
         if args.mode == "staged":
             files = _list_staged_files()
-            if not files:
+            first = next(files, None)
+            if first is None:
                 # In CI (and sometimes running pre-commit with --all-files)
                 # nothing is staged. Fall back to scanning the tracked repo so the
                 # hook still checks.
                 files = _list_repo_files()
                 mode = "repo"
+            else:
+                files = itertools.chain((first,), files)
         else:
             files = _list_repo_files()
+
+        violations = _check_paths(files, max_bytes=args.max_bytes, jobs=args.jobs)
     except RuntimeError as e:
         print(str(e), file=sys.stderr)
         return 2
 
-    violations = _check_paths(files, max_bytes=args.max_bytes)
     if not violations:
         print(f"[blocks_artifacts.py] OK ({mode}): no forbidden artifacts detected.")
         return 0
@@ -35,9 +35,13 @@ from __future__ import annotations
 
 import argparse
 import ast
+import os
 import subprocess
+import tokenize
 from collections.abc import Iterable
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
+from functools import cache
 from pathlib import Path
 from typing import TypeAlias
 
@@ -102,19 +106,23 @@ CORE_MODULES = [
 def run_git(args: list[str]) -> str:
     """Runs git as subprocess"""
     out = subprocess.check_output(["git", *args], cwd=ROOT)
-    return out.decode("utf-8", errors="replace").strip()
+    return out.decode("utf-8", errors="replace")
+
+
+def _split_z(out: str) -> list[str]:
+    """Splits `git ... -z` output: NUL-separated, unquoted paths (spaces/unicode safe)."""
+    return [p for p in out.split("\0") if p]
 
 
 def changed_files_from_range(diff_range: str) -> list[str]:
     """diff_range example: "origin/main...HEAD"""
-    out = run_git(["diff", "--name-only", "--diff-filter=ACMR", diff_range])
-    return [line.strip() for line in out.splitlines() if line.strip()]
+    return _split_z(run_git(["diff", "--name-only", "-z", "--diff-filter=ACMR", diff_range]))
 
 
+@cache
 def changed_files_staged() -> list[str]:
-    """Checks staged files only."""
-    out = run_git(["diff", "--cached", "--name-only", "--diff-filter=ACMR"])
-    return [line.strip() for line in out.splitlines() if line.strip()]
+    """Checks staged files only. One git call per run; later callers reuse the list."""
+    return _split_z(run_git(["diff", "--cached", "--name-only", "-z", "--diff-filter=ACMR"]))
 
 
 # -----------------------------
@@ -127,18 +135,52 @@ class Violation:
     message: str
 
 
-def parse_py(path: Path) -> ast.Module:
-    """Parses python files."""
-    src = path.read_text(encoding="utf-8")
+# Top-level statements the checks look at (docstrings, defs, __all__, relative imports).
+_KEPT_TOP_LEVEL = (
+    ast.FunctionDef,
+    ast.AsyncFunctionDef,
+    ast.ClassDef,
+    ast.Assign,
+    ast.ImportFrom,
+    ast.Expr,
+)
+
+
+def _prune(tree: ast.Module) -> None:
+    """
+    Drops what the checks never read before the tree is cached: other top-level
+    statements and every def/class body past its first statement (the docstring slot).
+    Function bodies are not checked, so nothing below the top level is kept.
+    """
+    head, rest = tree.body[:1], tree.body[1:]  # body[0] decides the module docstring
+    tree.body = head + [n for n in rest if isinstance(n, _KEPT_TOP_LEVEL)]
+    for node in tree.body:
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+            node.body = node.body[:1]
+
+
+@cache
+def _load(path_str: str) -> tuple[str, list[str], ast.Module]:
+    """
+    Reads + parses a file once per run: (source, lines, pruned module, see _prune).
+    Keyed on the resolved path, so api/core/init checks touching the same file share it.
+    """
+    src = Path(path_str).read_bytes().decode("utf-8")
     try:
-        tree = ast.parse(src, filename=str(path))
+        tree = ast.parse(src, filename=path_str, type_comments=False)
     except SyntaxError as e:
-        raise SystemExit(f"SyntaxError parsing {path}:{e.lineno}:{e.offset}: {e.msg}") from e
+        raise SystemExit(f"SyntaxError parsing {path_str}:{e.lineno}:{e.offset}: {e.msg}") from e
 
     # ast.parse returns a Module at runtime; make it explicit for the type-checker.
     if not isinstance(tree, ast.Module):
-        raise SystemExit(f"Internal error: expected ast.Module from ast.parse for {path}.")
-    return tree
+        raise SystemExit(f"Internal error: expected ast.Module from ast.parse for {path_str}.")
+    _prune(tree)
+    return src, src.splitlines(), tree
+
+
+def parse_py(path: Path) -> ast.Module:
+    """Parses python files (cached, see _load)."""
+    return _load(str(path.resolve()))[2]
 
 
 def module_docstring_ok(mod: ast.Module) -> bool:
@@ -147,8 +189,8 @@ def module_docstring_ok(mod: ast.Module) -> bool:
 
 
 def get_lines(path: Path) -> list[str]:
-    """Gets lines using path.read_text"""
-    return path.read_text(encoding="utf-8").splitlines()
+    """Gets source lines (cached with the parse, see _load)."""
+    return _load(str(path.resolve()))[1]
 
 
 def has_escape_with_reason(def_line: str) -> bool:
@@ -283,9 +325,38 @@ def check_api_file(path: Path) -> list[Violation]:
     return v
 
 
+def _has_module_docstring_fast(path: Path) -> bool:
+    """
+    Token-level docstring check that stops at the first statement (no AST build).
+    True only when certain: the file opens with plain string literal(s) ending the
+    statement, evaluating to a non-blank str. Anything else -> False (ask the AST).
+    """
+    literals: list[str] = []
+    try:
+        with path.open("rb") as f:
+            for tok in tokenize.tokenize(f.readline):
+                if tok.type in (tokenize.ENCODING, tokenize.NL, tokenize.COMMENT):
+                    continue
+                if tok.type == tokenize.STRING:
+                    literals.append(tok.string)
+                    continue
+                if not literals or tok.type not in (tokenize.NEWLINE, tokenize.ENDMARKER):
+                    return False
+                break
+    except (OSError, SyntaxError, tokenize.TokenError):
+        return False
+    try:
+        doc = ast.literal_eval(" ".join(literals))  # implicit concatenation, like the parser
+    except (ValueError, SyntaxError):  # f-strings etc.
+        return False
+    return isinstance(doc, str) and bool(doc.strip())
+
+
 def check_core_module(path: Path) -> list[Violation]:
-    """Checks for core infrastructure docstrings."""
+    """Checks for core infrastructure docstrings (token fast path, AST only if in doubt)."""
     v: list[Violation] = []
+    if _has_module_docstring_fast(path):
+        return v
     tree = parse_py(path)
     if not module_docstring_ok(tree):
         v.append(
@@ -375,6 +446,46 @@ def substitute_pkg(paths: Iterable[str], pkg_name: str) -> list[str]:
     return [p.replace("src/diffusion_core/", f"src/{pkg_name}/") for p in paths]
 
 
+@cache
+def _core_paths_for(pkg_name: str) -> frozenset[str]:
+    """CORE_MODULES for `pkg_name`, substituted once per package name."""
+    return frozenset(substitute_pkg(CORE_MODULES, pkg_name))
+
+
+# Below this many checks, worker start-up costs more than the checks themselves.
+POOL_MIN_TASKS = 4
+
+CheckTask: TypeAlias = tuple[str, Path, Path]  # (kind: api | core | init, path, pkg)
+
+
+def _dispatch(task: CheckTask) -> list[Violation]:
+    """Runs one check; module level so worker processes can unpickle it."""
+    kind, path, pkg = task
+    if kind == "init":
+        return check_init_exports(path, pkg)
+    if kind == "api":
+        return check_api_file(path)
+    return check_core_module(path)
+
+
+def run_checks(tasks: list[CheckTask]) -> list[Violation]:
+    """Runs checks across processes for larger sweeps; violations keep task order."""
+    if len(tasks) < POOL_MIN_TASKS:
+        results = [_dispatch(t) for t in tasks]
+    else:
+        workers = min(len(tasks), os.cpu_count() or 1)
+        chunksize = max(1, len(tasks) // (workers * 4))
+        with ProcessPoolExecutor(max_workers=workers) as ex:
+            results = list(ex.map(_dispatch, tasks, chunksize=chunksize))
+    return [vio for r in results for vio in r]
+
+
+def _rel_posix(path: Path, root_posix: str) -> str | None:
+    """Repo-relative posix path by plain prefix strip (no relative_to), None if outside."""
+    path_posix = path.as_posix()
+    return path_posix[len(root_posix) :] if path_posix.startswith(root_posix) else None
+
+
 def main() -> int:
     ap = argparse.ArgumentParser()
     ap.add_argument("--pkg", default=None, help="Package directory name under src/, diffusion_core")
@@ -390,7 +501,7 @@ def main() -> int:
     pkg_name = pkg.name
 
     # materialize configured paths
-    core_paths = set(substitute_pkg(CORE_MODULES, pkg_name))
+    core_paths = _core_paths_for(pkg_name)
     api_dir = pkg / "api"
     init_path = pkg / "__init__.py"
 
@@ -417,35 +528,42 @@ def main() -> int:
             p = ROOT / rel
             if p.exists():
                 candidates.append(p)
-        targets = sorted({p.resolve() for p in candidates})
+        # All candidates are built from ROOT (already resolved), so dedup on their posix
+        # strings instead of paying resolve()'s per-component stats for each one.
+        by_posix = {p.as_posix(): p for p in candidates}
+        targets = [by_posix[k] for k in sorted(by_posix)]
     else:
         targets = [ROOT / p for p in changed if p.endswith(".py")]
 
-    violations: list[Violation] = []
+    tasks: list[CheckTask] = []
+    root_posix = ROOT.as_posix() + "/"
+    init_rel = _rel_posix(init_path, root_posix)
+    api_prefix = f"{_rel_posix(api_dir, root_posix)}/" if api_dir.exists() else None
 
     # public API: api/ files
     for t in targets:
-        try:
-            rel = t.relative_to(ROOT).as_posix()
-        except ValueError:
+        rel = _rel_posix(t, root_posix)
+        if rel is None:
             continue
 
-        if rel == init_path.relative_to(ROOT).as_posix():
-            violations.extend(check_init_exports(init_path, pkg))
+        if rel == init_rel:
+            tasks.append(("init", init_path, pkg))
             continue
 
-        if api_dir.exists() and api_dir in t.parents:
-            violations.extend(check_api_file(t))
+        if api_prefix is not None and rel.startswith(api_prefix):
+            tasks.append(("api", t, pkg))
             continue
 
         if rel in core_paths:
-            violations.extend(check_core_module(t))
+            tasks.append(("core", t, pkg))
             continue
 
+    violations = run_checks(tasks)
+
     if violations:
         print("\nDocstring enforcement violations:\n")
         for vio in violations:
-            rel = vio.path.relative_to(ROOT).as_posix()
+            rel = _rel_posix(vio.path, root_posix) or vio.path.as_posix()
             print(f"- {rel}:{vio.lineno}: {vio.message}")
         print(
             "\nFix: add required docstrings, or use an ignore method with a reason "
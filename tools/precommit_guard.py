@@ -8,13 +8,27 @@ Fails the check if:
 - Commiting via detached HEAD
 - Commit is not based on latest origin/main (stale ref)
 
+origin/main is fetched at most once per FETCH_TTL_SECONDS (marker file in the git dir),
+so back-to-back commits don't each pay a network round trip. --no-fetch skips it entirely.
+
+Branch name and refs are read from the git dir's files where possible; git itself is only
+spawned for fetch / merge-base, or when the files can't settle it (unborn branch, reftable).
+
 Tested by: tests/test_precommit_guard.py
 """
 
 #!/usr/bin/env python3
 from __future__ import annotations
 
+import argparse
+import os
+import re
 import subprocess
+import time
+from pathlib import Path
+
+FETCH_TTL_SECONDS = 60
+FETCH_MARKER = ".precommit_guard_fetched"  # lives in the repo's git dir
 
 
 def sh(*cmd: str) -> tuple[int, str]:
@@ -23,12 +37,127 @@ def sh(*cmd: str) -> tuple[int, str]:
     return p.returncode, p.stdout.strip()
 
 
-def main() -> int:
+def _fetched_recently(git_dir: Path) -> bool:
+    """
+    True if the marker was touched by a successful fetch within FETCH_TTL_SECONDS.
+    A marker dated in the future (clock skew, NFS) is not fresh: it would never expire.
+    """
+    try:
+        age = time.time() - (git_dir / FETCH_MARKER).stat().st_mtime
+    except OSError:
+        return False
+    return 0 <= age < FETCH_TTL_SECONDS
+
+
+_SHA_RE = re.compile(r"[0-9a-f]{40}(?:[0-9a-f]{24})?")  # sha1 / sha256 object names
+
+
+def _packed_ref(common_dir: Path, ref: str) -> str | None:
+    """SHA for `ref` from packed-refs ("<sha> <ref>" lines), or None."""
+    for line in (common_dir / "packed-refs").read_text(encoding="utf-8").splitlines():
+        sha, _, name = line.partition(" ")
+        if name == ref:
+            return sha
+    return None
+
+
+def _read_ref(git_dir: Path, ref: str) -> str | None:
+    """
+    SHA that `ref` ("HEAD" or "refs/...") points at, read straight from the git dir's
+    files (no subprocess), following symbolic refs. None whenever that's not possible
+    (reftable, odd layouts, missing refs): the caller then asks git itself.
+    """
+    try:
+        common_dir = git_dir / (git_dir / "commondir").read_text(encoding="utf-8").strip()
+    except OSError:
+        common_dir = git_dir  # not a linked worktree
+    try:
+        for _ in range(5):  # bound symref chains
+            loose = (git_dir if ref == "HEAD" else common_dir) / ref
+            try:
+                val: str | None = loose.read_text(encoding="utf-8").strip()
+            except FileNotFoundError:
+                val = _packed_ref(common_dir, ref)
+            if val is None:
+                return None
+            if not val.startswith("ref: "):
+                return val if _SHA_RE.fullmatch(val) else None
+            ref = val[len("ref: ") :]
+    except (OSError, ValueError):
+        return None
+    return None
+
+
+# Env vars that change how git discovers the repo; with these set, let git do it.
+_DISCOVERY_ENV = ("GIT_WORK_TREE", "GIT_CEILING_DIRECTORIES", "GIT_DISCOVERY_ACROSS_FILESYSTEM")
+
+
+def _find_git_dir() -> Path | None:
+    """
+    The git dir for the cwd, found like git does (a .git dir, or a "gitdir: <path>"
+    file for worktrees/submodules) without spawning it. None if not found or unsure.
+    """
+    if env_git_dir := os.environ.get("GIT_DIR"):
+        return Path(env_git_dir)
+    if any(k in os.environ for k in _DISCOVERY_ENV):
+        return None
+    cwd = Path.cwd()
+    for d in (cwd, *cwd.parents):
+        dot_git = d / ".git"
+        if dot_git.is_dir():
+            return dot_git
+        if dot_git.is_file():
+            try:
+                gitfile = dot_git.read_text(encoding="utf-8").strip()
+            except (OSError, ValueError):
+                return None
+            if not gitfile.startswith("gitdir: "):
+                return None
+            return d / gitfile[len("gitdir: ") :]  # relative to the gitfile's dir
+    return None
+
+
+def _read_head(git_dir: Path) -> tuple[str | None, str | None]:
+    """
+    (branch, sha) from the HEAD file, as `rev-parse --abbrev-ref HEAD` would name it:
+    on a branch ("<branch>", None); detached ("HEAD", "<sha>").
+    (None, None) when HEAD can't be settled this way (unborn branch, reftable, ...).
+    """
+    try:
+        head = (git_dir / "HEAD").read_text(encoding="utf-8").strip()
+    except (OSError, ValueError):
+        return None, None
+    if head.startswith("ref: refs/heads/"):
+        # An unresolvable branch ref (unborn, or reftable's placeholder) goes to git.
+        if _read_ref(git_dir, "HEAD") is None:
+            return None, None
+        return head[len("ref: refs/heads/") :], None
+    if _SHA_RE.fullmatch(head):
+        return "HEAD", head
+    return None, None
+
+
+def main(argv: list[str] | None = None) -> int:
     """Must be on a real branch (not detached HEAD)."""
-    rc, branch = sh("git", "rev-parse", "--abbrev-ref", "HEAD")
-    if rc != 0:
-        print("[precommit_guard.py]: not a git repo (or git not available).")
-        return 1
+    ap = argparse.ArgumentParser()
+    ap.add_argument(
+        "--no-fetch",
+        action="store_true",
+        help="Don't fetch origin/main (CI/offline); check against the local origin/main ref.",
+    )
+    args = ap.parse_args(argv)
+
+    # Git dir (fetch marker) and branch name: read from files when possible,
+    # else one git call for both.
+    git_dir = _find_git_dir()
+    branch = _read_head(git_dir)[0] if git_dir is not None else None
+    if git_dir is None or branch is None:
+        rc, out = sh("git", "rev-parse", "--git-dir", "--abbrev-ref", "HEAD")
+        lines = out.splitlines()
+        if rc != 0 or len(lines) != 2:
+            print("[precommit_guard.py]: not a git repo (or git not available).")
+            return 1
+        git_dir, branch = Path(lines[0]), lines[1]
 
     if branch == "HEAD":
         print("[precommit_guard.py]: detached HEAD. Create a branch before committing.")
@@ -44,23 +173,37 @@ def main() -> int:
 
     # Must be based on latest origin/main (stale ref guard).
     # This intentionally fetches to avoid “it passed locally but CI fails”.
-    rc, out = sh("git", "fetch", "origin", "main", "--quiet")
-    if rc != 0:
-        print("[precommit_guard.py]: failed to fetch origin/main; cannot verify branch freshness.")
-        print(out)
-        return 1
-
-    rc, _ = sh("git", "show-ref", "--verify", "--quiet", "refs/remotes/origin/main")
-    if rc != 0:
-        print("[precommit_guard.py]: origin/main not found after fetch.")
-        return 1
+    fetched = not args.no_fetch and not _fetched_recently(git_dir)
+    if fetched:
+        rc, out = sh("git", "fetch", "origin", "main", "--quiet")
+        if rc != 0:
+            print(
+                "[precommit_guard.py]: failed to fetch origin/main; cannot verify branch freshness."
+            )
+            print(out)
+            return 1
+        (git_dir / FETCH_MARKER).touch()
+
+    # Branch still at the origin/main tip (typical right after branching): trivially fresh.
+    head_sha = _read_ref(git_dir, "HEAD")
+    if head_sha is not None and head_sha == _read_ref(git_dir, "refs/remotes/origin/main"):
+        return 0
 
     # Ensure origin/main is an ancestor of HEAD.
+    # (exit 1: not an ancestor; anything else, e.g. 128: origin/main doesn't exist)
     rc, _ = sh("git", "merge-base", "--is-ancestor", "origin/main", "HEAD")
-    if rc != 0:
+    if rc == 1:
         print("[precommit_guard.py]: your branch is not based on latest origin/main (stale ref).")
         print("   Fix: git rebase origin/main  (or merge origin/main) then re-commit.")
         return 1
+    if rc != 0:
+        if fetched:
+            print("[precommit_guard.py]: origin/main not found after fetch.")
+        else:
+            # --no-fetch or a recent fetch reused: only the local ref was checked.
+            print("[precommit_guard.py]: origin/main not found locally (no fetch this run).")
+            print("   Fix: git fetch origin main")
+        return 1
 
     return 0
 